@@ -4,50 +4,230 @@
 # Display the next actual data after each operation on the daily K-line
 # Add a checkbox named "Three Elements of Limit Up", after a limit up, encountering such a pullback, a big yang limit up appears at the low position, the second does not break half of the big yang position in the following three days, the third appears to swallow the yang K and swallow the previous three K lines, then the main force pull-up strategy is established. Implement an automatic reminder function for buying points based on this model content, and mark the number 3 on the buying point.
 
-import ccxt
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
-from mplfinance.original_flavor import candlestick_ohlc
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PolyCollection
 from PyQt5.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, QPushButton, QWidget, QLabel, QSizePolicy, QComboBox, QListWidget, QCheckBox
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QObject, QThread, QTimer, pyqtSignal
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 import random
-from matplotlib.animation import FuncAnimation
-
-
-# Initialize Gate.io exchange
-exchange = ccxt.gateio()
-
-def fetch_ohlcv_data(symbol, timeframe='1d', limit=200):
-    ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+import time
+
+from utils._njit import njit, HAVE_NUMBA
+
+
+# ccxt pulls in over a hundred exchange modules at import time, so defer it
+# until the first fetch (which happens off the GUI thread anyway)
+_exchange = None
+
+
+def _get_exchange():
+    global _exchange
+    if _exchange is None:
+        import ccxt
+        _exchange = ccxt.gateio()
+    return _exchange
+
+
+@njit(cache=True)
+def _rsi_wilder(close, n):
+    # Single-pass RSI using Wilder's smoothing (RMA, alpha=1/n): walk the close
+    # array once keeping running gain/loss averages instead of pandas rolling means.
+    size = close.shape[0]
+    rsi = np.empty(size)
+    for i in range(min(n, size)):
+        rsi[i] = np.nan
+    if size <= n:
+        return rsi
+
+    # Seed the averages with a plain mean over the first n deltas
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, n + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= n
+    avg_loss /= n
+    if avg_loss == 0.0:
+        rsi[n] = 100.0
+    else:
+        rsi[n] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    for i in range(n + 1, size):
+        delta = close[i] - close[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (n - 1) + gain) / n
+        avg_loss = (avg_loss * (n - 1) + loss) / n
+        if avg_loss == 0.0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return rsi
+
+
+@njit(cache=True)
+def _bbands(close, n, k):
+    # Bollinger Bands from running sum / sum-of-squares, one pass over the
+    # closes instead of two pandas rolling windows plus band arithmetic.
+    size = close.shape[0]
+    middle = np.empty(size)
+    upper = np.empty(size)
+    lower = np.empty(size)
+    for i in range(min(n - 1, size)):
+        middle[i] = np.nan
+        upper[i] = np.nan
+        lower[i] = np.nan
+    if size < n:
+        return middle, upper, lower
+
+    s = 0.0
+    ss = 0.0
+    for i in range(n):
+        s += close[i]
+        ss += close[i] * close[i]
+    for i in range(n - 1, size):
+        if i >= n:
+            s += close[i] - close[i - n]
+            ss += close[i] * close[i] - close[i - n] * close[i - n]
+        mean = s / n
+        # Sample variance (ddof=1), matching pandas rolling().std()
+        var = (ss - n * mean * mean) / (n - 1)
+        if var < 0.0:
+            var = 0.0
+        std = np.sqrt(var)
+        middle[i] = mean
+        upper[i] = mean + k * std
+        lower[i] = mean - k * std
+    return middle, upper, lower
+
+def _bbands_numpy(close, n, k):
+    # Vectorized fallback for _bbands when numba is unavailable: without JIT
+    # the kernel above runs as a plain Python loop, so use convolution-based
+    # window sums instead of iterating in the interpreter.
+    size = close.shape[0]
+    middle = np.full(size, np.nan)
+    upper = np.full(size, np.nan)
+    lower = np.full(size, np.nan)
+    if size < n:
+        return middle, upper, lower
+
+    window = np.ones(n)
+    mean = np.convolve(close, window, mode='valid') / n
+    s2 = np.convolve(close * close, window, mode='valid')
+    # Sample variance (ddof=1), matching pandas rolling().std()
+    var = (s2 - n * mean * mean) / (n - 1)
+    std = np.sqrt(np.maximum(var, 0.0))
+    middle[n - 1:] = mean
+    upper[n - 1:] = mean + k * std
+    lower[n - 1:] = mean - k * std
+    return middle, upper, lower
+
+
+def _candle_body_verts(x, o, c, width):
+    # (N, 4, 2) quad vertices for the candle bodies, built with one
+    # column_stack + reshape instead of a per-bar tuple comprehension
+    half = width / 2.0
+    return np.column_stack([x - half, o, x - half, c,
+                            x + half, c, x + half, o]).reshape(-1, 4, 2)
+
+
+def _candle_wick_segments(x, l, h):
+    # (N, 2, 2) vertical segments for the candle wicks
+    return np.column_stack([x, l, x, h]).reshape(-1, 2, 2)
+
+
+def find_three_elements_signals(df):
+    # Vectorized scan for the Three Elements of Limit Up pattern. Each signal
+    # at index i+4 checks a 5-bar window; instead of slicing the dataframe per
+    # window, evaluate the three conditions over shifted array views at once.
+    if len(df) < 5:
+        return np.empty(0, dtype=np.intp)
+
+    o = df['open'].to_numpy()
+    h = df['high'].to_numpy()
+    l = df['low'].to_numpy()
+    c = df['close'].to_numpy()
+
+    # 1. A big yang limit up appears at the low position (assume 9% is a limit up)
+    big_yang = c[:-4] > o[:-4] * 1.09
+
+    # 2. The following three days do not break half of the big yang position
+    half_position = (h[:-4] + l[:-4]) / 2
+    no_break = ((l[1:-3] >= half_position) &
+                (l[2:-2] >= half_position) &
+                (l[3:-1] >= half_position))
+
+    # 3. The last candle is yang and engulfs the previous three K lines
+    engulf = ((c[4:] > o[4:]) &
+              (h[4:] > np.maximum(np.maximum(h[1:-3], h[2:-2]), h[3:-1])) &
+              (l[4:] < np.minimum(np.minimum(l[1:-3], l[2:-2]), l[3:-1])))
+
+    return np.nonzero(big_yang & no_break & engulf)[0] + 4
+
+
+def fetch_ohlcv_data(symbol, timeframe='1d', limit=200, since=None):
+    ohlcv = _get_exchange().fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
     df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
     df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True).dt.tz_convert('Asia/Shanghai')
     df.set_index('timestamp', inplace=True)
     return df
 
 def calculate_indicators(df):
-    # Calculate Bollinger Bands
-    df['middle_band'] = df['close'].rolling(window=20).mean()
-    df['std'] = df['close'].rolling(window=20).std()
-    df['upper_band'] = df['middle_band'] + (df['std'] * 2)
-    df['lower_band'] = df['middle_band'] - (df['std'] * 2)
-
-    # Calculate RSI-13 and RSI-42
-    def calculate_rsi(data, periods):
-        delta = data.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=periods).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=periods).mean()
-        rs = gain / loss
-        return 100 - (100 / (1 + rs))
-
-    df['rsi_13'] = calculate_rsi(df['close'], 13)
-    df['rsi_42'] = calculate_rsi(df['close'], 42)
+    close = df['close'].to_numpy(np.float64)
+
+    # Calculate Bollinger Bands (running-sum kernel, one pass over the closes)
+    if HAVE_NUMBA:
+        middle, upper, lower = _bbands(close, 20, 2.0)
+    else:
+        middle, upper, lower = _bbands_numpy(close, 20, 2.0)
+    df['middle_band'] = middle
+    df['upper_band'] = upper
+    df['lower_band'] = lower
+
+    # Calculate RSI-13 and RSI-42 (Wilder's RMA, single pass over the close array)
+    df['rsi_13'] = _rsi_wilder(close, 13)
+    df['rsi_42'] = _rsi_wilder(close, 42)
+
+    # The derived columns are only ever displayed to two decimals, so float32
+    # halves the bytes the redraw path moves through matplotlib
+    for col in ('middle_band', 'upper_band', 'lower_band', 'rsi_13', 'rsi_42'):
+        df[col] = df[col].astype(np.float32)
 
     return df
 
+class OHLCVWorker(QObject):
+    # Fetches candles on a worker thread so the synchronous exchange
+    # round-trip doesn't block the Qt event loop
+    finished = pyqtSignal(str, str, object)
+    failed = pyqtSignal(str, str, str)
+
+    def __init__(self, symbol, timeframe, since=None):
+        super().__init__()
+        self.symbol = symbol
+        self.timeframe = timeframe
+        self.since = since
+
+    def run(self):
+        # Network and rate-limit errors are routine for the exchange; report
+        # them instead of letting the exception kill the slot, which would
+        # leak the thread and leave the UI stuck on the loading message
+        try:
+            df = fetch_ohlcv_data(self.symbol, self.timeframe, since=self.since)
+        except Exception as exc:
+            self.failed.emit(self.symbol, self.timeframe, str(exc))
+            return
+        self.finished.emit(self.symbol, self.timeframe, df)
+
+
 class TradingSimulator(QMainWindow):
+    DF_CACHE_TTL = 60  # seconds before a cached dataframe is considered stale
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Crypto Trading Simulator")  # Update window title
@@ -72,6 +252,7 @@ class TradingSimulator(QMainWindow):
                                                                    sharex=True)
         self.canvas = FigureCanvas(self.figure)
         chart_layout.addWidget(self.canvas)
+        self._init_chart_artists()
         
         # Set size policy for the left area
         chart_widget.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
@@ -110,7 +291,7 @@ class TradingSimulator(QMainWindow):
         
         # Add "Three Elements of Limit Up" checkbox
         self.three_elements_checkbox = QCheckBox("Three Elements of Limit Up")
-        self.three_elements_checkbox.stateChanged.connect(self.update_chart)
+        self.three_elements_checkbox.stateChanged.connect(self.update_annotations_only)
         info_button_layout.addWidget(self.three_elements_checkbox)
         
         # Set size policy for the right area
@@ -123,34 +304,127 @@ class TradingSimulator(QMainWindow):
         self.end_button.clicked.connect(self.end_simulation)  # Connect End button to new method
 
         self.symbol = 'BTC/USDT'  # Default trading pair
+        self.crypto_symbol = self.symbol.split('/')[0]
         self.timeframe = '1d'
-        self.df = fetch_ohlcv_data(self.symbol, self.timeframe)
-        self.df = calculate_indicators(self.df)
-        
+        self._df_cache = {}  # (symbol, timeframe) -> (fetch time, df with indicators)
+        self.df = None
+        self._pending_fetch = None  # (key, on_ready) for the request in flight
+
+        self.balance = 1000
+        self.crypto_holdings = 0
+        self.trade_log = []
+        self.trade_marks = []
+
+        # Trading stays disabled until the first dataframe arrives
+        self.disable_trading_buttons()
+        self._request_df(self.symbol, self.timeframe, self._start_new_run)
+
+    def _request_df(self, symbol, timeframe, on_ready):
+        # Serve fresh cache hits synchronously; otherwise fetch on a worker
+        # thread and deliver the dataframe to on_ready once it arrives, so
+        # the UI stays responsive during the exchange round-trip
+        key = (symbol, timeframe)
+        cached = self._df_cache.get(key)
+        since = None
+        if cached is not None:
+            fetched_at, df, three_elem_idx = cached
+            if time.monotonic() - fetched_at < self.DF_CACHE_TTL:
+                # This request supersedes any fetch still in flight; drop the
+                # pending key so a late response can't overwrite this df
+                self._pending_fetch = None
+                self._three_elem_idx = three_elem_idx
+                on_ready(df)
+                return
+            # Stale cache: fetch only the bars after the last cached timestamp
+            # instead of re-downloading the full 200-bar history
+            since = int(df.index[-1].timestamp() * 1000) + 1
+        self._pending_fetch = (key, on_ready)
+        self.info_label.setText(f"Loading {symbol} {timeframe}...")
+        self._fetch_thread = QThread(self)
+        self._fetch_worker = OHLCVWorker(symbol, timeframe, since)
+        self._fetch_worker.moveToThread(self._fetch_thread)
+        self._fetch_thread.started.connect(self._fetch_worker.run)
+        self._fetch_worker.finished.connect(self._on_df_ready)
+        self._fetch_worker.failed.connect(self._on_df_failed)
+        for signal in (self._fetch_worker.finished, self._fetch_worker.failed):
+            signal.connect(self._fetch_thread.quit)
+            signal.connect(self._fetch_worker.deleteLater)
+        self._fetch_thread.finished.connect(self._fetch_thread.deleteLater)
+        self._fetch_thread.start()
+
+    def _on_df_ready(self, symbol, timeframe, df):
+        key = (symbol, timeframe)
+        if self._pending_fetch is None or self._pending_fetch[0] != key:
+            return  # superseded by a newer request
+        _, on_ready = self._pending_fetch
+        self._pending_fetch = None
+        cached = self._df_cache.get(key)
+        if cached is not None:
+            # Delta fetch: append the new bars to the stale frame, drop
+            # duplicated timestamps, and keep the most recent 200 bars.
+            # Indicators are recomputed over the merged frame; the kernels
+            # are single-pass, so that costs the same as a tail recompute.
+            df = pd.concat([cached[1], df])
+            df = df[~df.index.duplicated(keep='last')].iloc[-200:]
+        df = calculate_indicators(df)
+        # The pattern depends only on OHLC, so scan once per dataframe and
+        # cache the signal indices; update_chart just filters the visible ones
+        self._three_elem_idx = find_three_elements_signals(df)
+        self._df_cache[key] = (time.monotonic(), df, self._three_elem_idx)
+        on_ready(df)
+
+    def _on_df_failed(self, symbol, timeframe, message):
+        key = (symbol, timeframe)
+        if self._pending_fetch is None or self._pending_fetch[0] != key:
+            return  # superseded by a newer request
+        self._pending_fetch = None
+        # Pair and timeframe selection stay live, so the user can retry by
+        # picking an entry again; any already-loaded chart keeps working
+        self.info_label.setText(f"Failed to load {symbol} {timeframe}:\n{message}")
+
+    def _start_new_run(self, df):
+        # Reset the simulation state for a fresh dataframe
+        self.df = df
+        self._refresh_arrays()
+
         # Ensure there's enough data to calculate RSI-42
         min_index = 42
         max_index = len(self.df) - 100
-        
+
         if max_index > min_index:
             self.current_index = random.randint(min_index, max_index)
         else:
             self.current_index = min_index
-        
+
         self.balance = 1000
         self.crypto_holdings = 0
         self.trade_log = []
         self.trade_marks = []
 
+        # Re-enable buttons
+        self.enable_trading_buttons()
+
         self.update_chart()
         self.update_info()
 
+    def _refresh_arrays(self):
+        # Per-column ndarrays of self.df for hot-path scalar access. Indexing
+        # these directly skips the Series construction that every
+        # df.iloc[i]['col'] lookup pays for.
+        self._arr = {col: self.df[col].to_numpy() for col in (
+            'open', 'high', 'low', 'close', 'volume',
+            'rsi_13', 'rsi_42', 'upper_band', 'middle_band', 'lower_band')}
+        # Matplotlib date numbers, converted once for the whole index instead
+        # of mapping date2num element-wise on every redraw
+        self._arr['date_num'] = mdates.date2num(self.df.index.to_pydatetime())
+
     def end_simulation(self):
         self.show_final_results()
         self.disable_trading_buttons()
 
     def show_final_results(self):
-        crypto_symbol = self.symbol.split('/')[0]
-        current_price = self.df.iloc[self.current_index]['close']
+        crypto_symbol = self.crypto_symbol
+        current_price = self._arr['close'][self.current_index]
         final_value = self.balance + (self.crypto_holdings * current_price)
         total_return = (final_value - 1000) / 1000 * 100
         result_text = (
@@ -172,28 +446,8 @@ class TradingSimulator(QMainWindow):
 
     def change_trading_pair(self, new_pair):
         self.symbol = new_pair
-        self.df = fetch_ohlcv_data(self.symbol, self.timeframe)
-        self.df = calculate_indicators(self.df)
-        
-        # Ensure there's enough data to calculate RSI-42
-        min_index = 42
-        max_index = len(self.df) - 100
-        
-        if max_index > min_index:
-            self.current_index = random.randint(min_index, max_index)
-        else:
-            self.current_index = min_index
-        
-        self.balance = 1000
-        self.crypto_holdings = 0
-        self.trade_log = []
-        self.trade_marks = []
-        
-        # Re-enable buttons
-        self.enable_trading_buttons()
-        
-        self.update_chart()
-        self.update_info()
+        self.crypto_symbol = new_pair.split('/')[0]
+        self._request_df(new_pair, self.timeframe, self._start_new_run)
 
     def enable_trading_buttons(self):
         self.buy_button.setEnabled(True)
@@ -202,19 +456,19 @@ class TradingSimulator(QMainWindow):
         self.end_button.setEnabled(True)
 
     def action_clicked(self, action):
-        current_data = self.df.iloc[self.current_index]
-        crypto_symbol = self.symbol.split('/')[0]
+        close = self._arr['close'][self.current_index]
+        crypto_symbol = self.crypto_symbol
 
         if action == 'buy' and self.balance > 0:
-            crypto_bought = self.balance / current_data['close']
+            crypto_bought = self.balance / close
             self.crypto_holdings += crypto_bought
             self.balance = 0
-            self.trade_log.append(f"Bought {crypto_bought:.2f} {crypto_symbol} at {current_data['close']}")
+            self.trade_log.append(f"Bought {crypto_bought:.2f} {crypto_symbol} at {close}")
             self.trade_marks.append((self.current_index, 'B'))
         elif action == 'sell' and self.crypto_holdings > 0:
-            self.balance = self.crypto_holdings * current_data['close']
+            self.balance = self.crypto_holdings * close
             profit_loss = (self.balance - 1000) / 1000 * 100
-            self.trade_log.append(f"Sold {self.crypto_holdings:.2f} {crypto_symbol} at {current_data['close']}. P/L: {profit_loss:.2f}%")
+            self.trade_log.append(f"Sold {self.crypto_holdings:.2f} {crypto_symbol} at {close}. P/L: {profit_loss:.2f}%")
             self.crypto_holdings = 0
             self.trade_marks.append((self.current_index, 'S'))
 
@@ -227,28 +481,79 @@ class TradingSimulator(QMainWindow):
 
     def change_timeframe(self, timeframe):
         self.timeframe = timeframe
-        self.df = fetch_ohlcv_data(self.symbol, self.timeframe)
-        self.df = calculate_indicators(self.df)
+        self._request_df(self.symbol, timeframe, self._on_timeframe_df)
+
+    def _on_timeframe_df(self, df):
+        self.df = df
+        self._refresh_arrays()
         self.current_index = len(self.df) - 100
         self.trade_marks = []  # Clear trade marks
         self.update_chart()
         self.update_info()
 
+    def _init_chart_artists(self):
+        # Create the static decorations and the persistent line artists once.
+        # update_chart only feeds new data into these instead of clearing and
+        # rebuilding all three axes on every redraw.
+        # Candles batched into four collections (up/down bodies and wicks)
+        # instead of two artists per bar
+        self._candle_wicks_up = LineCollection([], colors='g')
+        self._candle_wicks_down = LineCollection([], colors='r')
+        self._candle_bodies_up = PolyCollection([], facecolors='g', edgecolors='g')
+        self._candle_bodies_down = PolyCollection([], facecolors='r', edgecolors='r')
+        for collection in (self._candle_wicks_up, self._candle_wicks_down,
+                           self._candle_bodies_up, self._candle_bodies_down):
+            self.ax1.add_collection(collection)
+
+        self._bb_upper_line, = self.ax1.plot([], [], 'y--', label='Upper BB')
+        self._bb_mid_line, = self.ax1.plot([], [], 'b-', label='Middle BB')
+        self._bb_lower_line, = self.ax1.plot([], [], 'b--', label='Lower BB')
+        self.ax1.legend()
+
+        self.ax2.set_title('Volume')
+
+        self._rsi13_line, = self.ax3.plot([], [], label='RSI-13')
+        self._rsi42_line, = self.ax3.plot([], [], label='RSI-42')
+        self.ax3.axhline(y=70, color='r', linestyle='--')
+        self.ax3.axhline(y=30, color='r', linestyle='--')
+        self.ax3.set_title('RSI')
+        self.ax3.legend()
+        self.ax3.set_ylim(0, 100)
+
+        # Volume bars still get replaced each frame; tracked so they can be
+        # removed cheaply. Text marks come from a pool of reusable artists.
+        self._volume_bars = []
+        self._mark_text_pool = []
+
+        # Rendered background of ax1 without text marks, used to blit
+        # annotation-only updates; invalidated by resizes and full redraws
+        self._ax1_bg = None
+        self.canvas.mpl_connect('resize_event', self._on_canvas_resize)
+
+        self.figure.tight_layout()
+
+    def _on_canvas_resize(self, event):
+        self._ax1_bg = None
+
     def update_chart(self):
-        # Clear the current plot
-        for ax in (self.ax1, self.ax2, self.ax3):
-            ax.clear()
+        if self.df is None:
+            return  # first fetch still in flight
 
         # Set fixed display count of K lines
         display_count = 100
         start_index = max(0, self.current_index - display_count + 1)
         end_index = self.current_index + 1
-        current_df = self.df.iloc[start_index:end_index]
-        
-        # Candlestick chart
-        ohlc = current_df[['open', 'high', 'low', 'close']].reset_index()
-        ohlc['timestamp'] = ohlc['timestamp'].map(mdates.date2num)
-        
+
+        # Zero-copy views of the visible window: slicing the cached SoA
+        # arrays avoids materializing an intermediate dataframe per redraw
+        s = slice(start_index, end_index)
+        x = self._arr['date_num'][s]
+        o = self._arr['open'][s]
+        h = self._arr['high'][s]
+        l = self._arr['low'][s]
+        c = self._arr['close'][s]
+        v = self._arr['volume'][s]
+
         # Adjust candle width based on time frame
         if self.timeframe == '1d':
             width = 0.6
@@ -258,55 +563,33 @@ class TradingSimulator(QMainWindow):
             width = 0.03
         else:
             width = 0.6  # Default width
-        
-        candlestick_ohlc(self.ax1, ohlc.values, width=width, colorup='g', colordown='r')
-        self.ax1.plot(current_df.index, current_df['upper_band'], 'y--', label='Upper BB')
-        self.ax1.plot(current_df.index, current_df['middle_band'], 'b-', label='Middle BB')
-        self.ax1.plot(current_df.index, current_df['lower_band'], 'b--', label='Lower BB')
+
+        # Feed new vertices into the four persistent candle collections,
+        # grouped into up/down sets by color
+        up = c >= o
+        down = ~up
+        self._candle_wicks_up.set_segments(_candle_wick_segments(x[up], l[up], h[up]))
+        self._candle_wicks_down.set_segments(_candle_wick_segments(x[down], l[down], h[down]))
+        self._candle_bodies_up.set_verts(_candle_body_verts(x[up], o[up], c[up], width))
+        self._candle_bodies_down.set_verts(_candle_body_verts(x[down], o[down], c[down], width))
+
+        self._bb_upper_line.set_data(x, self._arr['upper_band'][s])
+        self._bb_mid_line.set_data(x, self._arr['middle_band'][s])
+        self._bb_lower_line.set_data(x, self._arr['lower_band'][s])
         self.ax1.set_title(f'{self.symbol} {self.timeframe} Candlestick Chart with Bollinger Bands')
-        self.ax1.legend()
 
-        # Volume chart with color based on price movement and adjusted width
-        colors = ['g' if close >= open else 'r' for open, close in zip(current_df['open'], current_df['close'])]
-        self.ax2.bar(current_df.index, current_df['volume'], color=colors, width=width, align='center')
-        self.ax2.set_title('Volume')
+        # Volume chart colored by price movement: reuse the candle up/down
+        # masks and draw one green and one red bar group instead of building
+        # a per-bar color list by iterating two Series
+        for bar in self._volume_bars:
+            bar.remove()
+        self._volume_bars = (
+            list(self.ax2.bar(x[up], v[up], color='g', width=width, align='center')) +
+            list(self.ax2.bar(x[down], v[down], color='r', width=width, align='center')))
 
         # RSI chart
-        self.ax3.plot(current_df.index, current_df['rsi_13'], label='RSI-13')
-        self.ax3.plot(current_df.index, current_df['rsi_42'], label='RSI-42')
-        self.ax3.axhline(y=70, color='r', linestyle='--')
-        self.ax3.axhline(y=30, color='r', linestyle='--')
-        self.ax3.set_title('RSI')
-        self.ax3.legend()
-
-        # Draw trade marks
-        for index, mark in self.trade_marks:
-            if start_index <= index <= end_index:
-                x = current_df.index[index - start_index]
-                open_price = current_df['open'].iloc[index - start_index]
-                close_price = current_df['close'].iloc[index - start_index]
-                color = 'g' if mark == 'B' else 'r'
-                
-                if close_price >= open_price:
-                    y = close_price
-                    xytext = (0, 5)  # Upward阳线，标记在上方
-                    va = 'bottom'
-                else:
-                    y = close_price
-                    xytext = (0, -5)  # Downward阴线，标记在下方
-                    va = 'top'
-                
-                self.ax1.annotate(mark, (x, y), xytext=xytext, 
-                                  textcoords='offset points', 
-                                  color=color, fontweight='bold', 
-                                  ha='center', va=va)
-
-        if self.three_elements_checkbox.isChecked():
-            buy_signals = self.find_three_elements_signals(current_df)
-            for index, signal in buy_signals:
-                self.ax1.annotate('3', (current_df.index[index], current_df['high'].iloc[index]),
-                                  xytext=(0, 5), textcoords='offset points',
-                                  ha='center', va='bottom', color='g', fontweight='bold')
+        self._rsi13_line.set_data(x, self._arr['rsi_13'][s])
+        self._rsi42_line.set_data(x, self._arr['rsi_42'][s])
 
         # Adjust x-axis date format based on time frame
         if self.timeframe == '1d':
@@ -322,74 +605,151 @@ class TradingSimulator(QMainWindow):
             date_format = '%m-%d'
             locator = mdates.WeekdayLocator(byweekday=mdates.MO)
 
-        # Set x-axis range, leaving a time unit's worth of space on both sides
-        date_range = (current_df.index[-1] - current_df.index[0])
+        # Width of one time unit in matplotlib date (day) units, used to leave
+        # a bar's worth of space on both sides of the x-axis
         if self.timeframe == '1d':
-            time_unit = pd.Timedelta(days=1)
+            time_unit = 1.0
         elif self.timeframe == '4h':
-            time_unit = pd.Timedelta(hours=4)
+            time_unit = 4.0 / 24.0
         elif self.timeframe == '1h':
-            time_unit = pd.Timedelta(hours=1)
+            time_unit = 1.0 / 24.0
         else:
-            time_unit = pd.Timedelta(days=1)
+            time_unit = 1.0
 
-        x_min = current_df.index[0] - time_unit
-        x_max = current_df.index[-1] + time_unit
+        x_min = x[0] - time_unit
+        x_max = x[-1] + time_unit
 
         for ax in (self.ax1, self.ax2, self.ax3):
             ax.set_xlim(x_min, x_max)
 
+        # Explicit y limits: with persistent artists the axes are never
+        # cleared, so stale data limits must not leak into autoscaling
+        y_min = np.nanmin(l)
+        y_max = np.nanmax(h)
+        band_lo = self._arr['lower_band'][s]
+        if not np.isnan(band_lo).all():
+            y_min = min(y_min, np.nanmin(band_lo))
+            y_max = max(y_max, np.nanmax(self._arr['upper_band'][s]))
+        pad = (y_max - y_min) * 0.05
+        self.ax1.set_ylim(y_min - pad, y_max + pad)
+        self.ax2.set_ylim(0, np.nanmax(v) * 1.1)
+
         # Format x-axis date
         self.ax3.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
         self.ax3.xaxis.set_major_locator(locator)
         self.figure.autofmt_xdate()
 
-        self.figure.tight_layout()
+        # Draw everything except the text marks, then capture the background
+        # so mark-only updates (checkbox toggle) can blit instead of redrawing
+        for txt in self._mark_text_pool:
+            txt.set_visible(False)
         self.canvas.draw()
+        self._ax1_bg = self.canvas.copy_from_bbox(self.ax1.bbox)
+        self._visible_slice = (start_index, end_index)
+        self._visible_x = x
+        self._draw_marks()
+
+    def _get_mark_text(self, i):
+        # Grow the pool lazily; pooled artists get reconfigured and re-shown
+        # instead of being created and destroyed on every redraw
+        while len(self._mark_text_pool) <= i:
+            txt = self.ax1.annotate('', (0, 0), xytext=(0, 0),
+                                    textcoords='offset points',
+                                    ha='center', fontweight='bold')
+            txt.set_visible(False)
+            self._mark_text_pool.append(txt)
+        return self._mark_text_pool[i]
+
+    def _draw_marks(self):
+        # Update the pooled trade / three-elements text marks for the visible
+        # window and blit them on top of the cached background
+        start_index, end_index = self._visible_slice
+        x = self._visible_x
+        n = 0
+
+        if self.trade_marks:
+            # Branchless placement: map trade indices to positions and pick
+            # offset/alignment/color with np.where instead of a per-trade
+            # if/else (marks sit above阳线, below阴线, always at the close)
+            trade_idx = np.array([index for index, _ in self.trade_marks])
+            marks = np.array([mark for _, mark in self.trade_marks])
+            up_mask = self._arr['close'][trade_idx] >= self._arr['open'][trade_idx]
+            y_vals = self._arr['close'][trade_idx]
+            y_off = np.where(up_mask, 5, -5)
+            va = np.where(up_mask, 'bottom', 'top')
+            colors = np.where(marks == 'B', 'g', 'r')
+            visible = (trade_idx >= start_index) & (trade_idx <= end_index)
+
+            for k in np.nonzero(visible)[0]:
+                txt = self._get_mark_text(n)
+                n += 1
+                txt.xy = (x[trade_idx[k] - start_index], y_vals[k])
+                txt.xyann = (0, y_off[k])
+                txt.set_text(marks[k])
+                txt.set_color(colors[k])
+                txt.set_va(va[k])
+                txt.set_visible(True)
+
+        if self.three_elements_checkbox.isChecked():
+            idx = self._three_elem_idx
+            for index in idx[(idx >= start_index) & (idx < end_index)] - start_index:
+                txt = self._get_mark_text(n)
+                n += 1
+                txt.xy = (x[index], self._arr['high'][start_index + index])
+                txt.xyann = (0, 5)
+                txt.set_text('3')
+                txt.set_color('g')
+                txt.set_va('bottom')
+                txt.set_visible(True)
+
+        # Hide pool entries left over from the previous frame
+        for txt in self._mark_text_pool[n:]:
+            txt.set_visible(False)
+
+        for txt in self._mark_text_pool[:n]:
+            self.ax1.draw_artist(txt)
+        self.canvas.blit(self.ax1.bbox)
+
+    def update_annotations_only(self):
+        # Fast path for checkbox toggles: restore the cached background and
+        # redraw just the text marks instead of a full canvas.draw()
+        if self._ax1_bg is None:
+            self.update_chart()
+            return
+        self.canvas.restore_region(self._ax1_bg)
+        self._draw_marks()
 
     def update_info(self):
-        current_data = self.df.iloc[self.current_index]
-        crypto_symbol = self.symbol.split('/')[0]
+        i = self.current_index
+        crypto_symbol = self.crypto_symbol
         info_text = (
-            f"Date: {current_data.name.date()}\n"
-            f"Close: {current_data['close']}\n"
-            f"RSI-13: {current_data['rsi_13']:.2f}\n"
-            f"RSI-42: {current_data['rsi_42']:.2f}\n"
+            f"Date: {self.df.index[i].date()}\n"
+            f"Close: {self._arr['close'][i]}\n"
+            f"RSI-13: {self._arr['rsi_13'][i]:.2f}\n"
+            f"RSI-42: {self._arr['rsi_42'][i]:.2f}\n"
             f"Current balance: {self.balance:.2f} USDT\n"
             f"Current {crypto_symbol} holdings: {self.crypto_holdings}"
         )
         self.info_label.setText(info_text)
 
-    def find_three_elements_signals(self, df):
-        signals = []
-        for i in range(4, len(df)):
-            if self.is_three_elements_pattern(df.iloc[i-4:i+1]):
-                signals.append((i, 'buy'))
-        return signals
-
-    def is_three_elements_pattern(self, window):
-        # Check if the conditions for the Three Elements of Limit Up are met
-        # 1. A big yang limit up appears at the low position
-        if not (window.iloc[0]['close'] > window.iloc[0]['open'] * 1.09):  # Assume a 9% increase is a limit up
-            return False
-
-        # 2. The second does not break half of the big yang position in the following three days
-        half_position = (window.iloc[0]['high'] + window.iloc[0]['low']) / 2
-        if any(window.iloc[1:4]['low'] < half_position):
-            return False
-
-        # 3. The third appears to swallow the yang K and swallow the previous three K lines
-        last_candle = window.iloc[-1]
-        if not (last_candle['close'] > last_candle['open'] and
-                last_candle['high'] > window.iloc[1:4]['high'].max() and
-                last_candle['low'] < window.iloc[1:4]['low'].min()):
-            return False
-
-        return True
-
     def start_animation(self):
-        # Use FuncAnimation for dynamic updates
-        self.ani = FuncAnimation(self.figure, self.update_chart, interval=1000, blit=True)
+        # Advance one bar per second with a plain QTimer. FuncAnimation with
+        # blit=True needed update_chart to return an artist list (it never
+        # did), so it silently fell back to full redraws anyway.
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._tick)
+        self._timer.start(1000)
+
+    def _tick(self):
+        if self.df is None:
+            return  # first fetch still in flight
+        self.current_index += 1
+        if self.current_index >= len(self.df) - 1:
+            self._timer.stop()
+            self.end_simulation()
+            return
+        self.update_chart()
+        self.update_info()
 
 if __name__ == "__main__":
     app = QApplication([])
@@ -0,0 +1,16 @@
+# Optional numba support: fall back to a no-op decorator when numba is not
+# installed, so the indicator kernels still run (just without JIT compilation).
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+
+        def wrapper(func):
+            return func
+        return wrapper